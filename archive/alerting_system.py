@@ -7,6 +7,7 @@ Implements comprehensive alerting for DinoAir system failures and critical event
 import json
 import time
 import smtplib
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -352,7 +353,7 @@ class AlertManager:
         self.channels: Dict[str, NotificationChannel] = {}
         self.alert_history: List[Alert] = []
         self.rule_cooldowns: Dict[str, datetime] = {}
-        self.rule_counters: Dict[str, List[datetime]] = {}
+        self.rule_counters: Dict[str, deque] = {}
         
         self._setup_channels()
         self._load_rules()
@@ -506,16 +507,17 @@ class AlertManager:
                     
             # Check rate limiting
             if rule.id in self.rule_counters:
-                # Remove old entries
+                # Remove old entries; timestamps are appended in order so
+                # expired ones are always at the left end
                 hour_ago = current_time - timedelta(hours=1)
-                self.rule_counters[rule.id] = [
-                    ts for ts in self.rule_counters[rule.id] if ts > hour_ago
-                ]
+                counter = self.rule_counters[rule.id]
+                while counter and counter[0] <= hour_ago:
+                    counter.popleft()
                 
-                if len(self.rule_counters[rule.id]) >= rule.max_alerts_per_hour:
+                if len(counter) >= rule.max_alerts_per_hour:
                     continue
             else:
-                self.rule_counters[rule.id] = []
+                self.rule_counters[rule.id] = deque()
                 
             # Evaluate condition
             try:
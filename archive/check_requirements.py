@@ -462,16 +462,18 @@ class EnhancedSystemChecker:
         connectivity_score = 0
         for host, port in test_hosts:
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex((host, port))
-                sock.close()
-                
-                if result == 0:
-                    details["connectivity"][host] = "success"
-                    connectivity_score += 1
-                else:
-                    details["connectivity"][host] = "failed"
+                # create_connection resolves the host once and tries each
+                # address family in turn (IPv6 included), closing on exit
+                with socket.create_connection((host, port), timeout=5):
+                    pass
+                details["connectivity"][host] = "success"
+                connectivity_score += 1
+            except socket.gaierror as e:
+                # Name resolution problems are reported, not counted as unreachable
+                details["connectivity"][host] = f"error: {e}"
+            except OSError:
+                # Timeouts, refusals and ENETUNREACH/EHOSTUNREACH alike
+                details["connectivity"][host] = "failed"
             except Exception as e:
                 details["connectivity"][host] = f"error: {e}"
         
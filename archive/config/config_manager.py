@@ -1,10 +1,83 @@
 import os
 import json
+import shutil
+import tempfile
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Optional faster JSON codec
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Whether data holds NaN/Infinity, which orjson would silently write as null"""
+    if isinstance(data, float):
+        return data != data or data in (float("inf"), float("-inf"))
+    if isinstance(data, dict):
+        return any(_has_non_finite(v) for v in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(v) for v in data)
+    return False
+
+
+def _json_load(f) -> Any:
+    """Parse JSON from a binary file object"""
+    raw = f.read()
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files written by the stdlib may contain NaN/Infinity tokens
+            pass
+    return json.loads(raw)
+
+
+def _json_dump(data: Any, f):
+    """Write indented JSON to a binary file object"""
+    if HAS_ORJSON and not _has_non_finite(data):
+        try:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError; let the stdlib
+            # encoder handle whatever orjson refuses
+            pass
+    f.write(json.dumps(data, indent=2).encode("utf-8"))
+
+
+def _new_file_mode() -> int:
+    """Mode a plain open() would give a new file under the current umask"""
+    # The umask can only be read by setting it, so restore it straight away
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _yaml_load(f) -> Any:
+    """Parse YAML from a binary file object"""
+    return yaml.load(f, Loader=_YamlLoader)
+
+
+def _yaml_dump(data: Any, f):
+    """Write block-style YAML to a binary file object"""
+    yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, encoding="utf-8")
+
+
+# File suffix -> reader/writer, resolved once instead of branching per call
+_LOADERS = {".json": _json_load, ".yaml": _yaml_load, ".yml": _yaml_load}
+_DUMPERS = {".json": _json_dump, ".yaml": _yaml_dump, ".yml": _yaml_dump}
+
+
 class ConfigManager:
     """Centralized configuration management for DinoAir"""
     
@@ -34,15 +107,13 @@ class ConfigManager:
             self.create_default_config(config_name)
         
         # Load based on file extension
-        if config_file.suffix == ".json":
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-        elif config_file.suffix in [".yaml", ".yml"]:
-            with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
-        else:
+        loader = _LOADERS.get(config_file.suffix)
+        if loader is None:
             raise ValueError(f"Unsupported config format: {config_file.suffix}")
         
+        with open(config_file, 'rb') as f:
+            config = loader(f)
+        
         # Merge with environment variables
         config = self.merge_with_env(config)
         
@@ -126,12 +197,7 @@ class ConfigManager:
         
         if config_name in defaults:
             config_file = self.config_dir / self.config_files[config_name]
-            
-            with open(config_file, 'w') as f:
-                if config_file.suffix == ".json":
-                    json.dump(defaults[config_name], f, indent=2)
-                else:
-                    yaml.dump(defaults[config_name], f, default_flow_style=False)
+            self._write_config_file(config_file, defaults[config_name])
     
     def update_config(self, config_name: str, updates: Dict[str, Any]):
         """Update configuration and save to file"""
@@ -139,16 +205,37 @@ class ConfigManager:
         config.update(updates)
         
         config_file = self.config_dir / self.config_files[config_name]
-        
-        with open(config_file, 'w') as f:
-            if config_file.suffix == ".json":
-                json.dump(config, f, indent=2)
-            else:
-                yaml.dump(config, f, default_flow_style=False)
+        self._write_config_file(config_file, config)
         
         # Update cache
         self.config_cache[config_name] = config
     
+    def _write_config_file(self, config_file: Path, config: Dict[str, Any]):
+        """Write configuration in the format matching the file extension.
+        
+        The data is written to a temporary file beside the target and then
+        renamed over it, so readers never observe a half-written config.
+        The result keeps the existing file's permissions; a new file gets
+        the usual umask-derived mode.
+        """
+        dumper = _DUMPERS.get(config_file.suffix, _yaml_dump)
+        tmp = tempfile.NamedTemporaryFile(
+            dir=config_file.parent, prefix=f".{config_file.name}.",
+            suffix=".tmp", delete=False
+        )
+        tmp_file = Path(tmp.name)
+        try:
+            with tmp:
+                dumper(config, tmp)
+            if config_file.exists():
+                shutil.copymode(config_file, tmp_file)
+            else:
+                os.chmod(tmp_file, _new_file_mode())
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    
     def validate_config(self) -> bool:
         """Validate all configuration files"""
         required_configs = ["main", "services", "security"]
@@ -17,6 +17,24 @@ from lib.config import (
     load_config
 )
 
+# CLI section name -> ConfigSection, built once at import
+SECTION_MAP = {
+    'server': ConfigSection.SERVER,
+    'database': ConfigSection.DATABASE,
+    'security': ConfigSection.SECURITY,
+    'comfyui': ConfigSection.COMFYUI,
+    'ollama': ConfigSection.OLLAMA,
+    'resources': ConfigSection.RESOURCES,
+    'logging': ConfigSection.LOGGING,
+    'monitoring': ConfigSection.MONITORING
+}
+
+# CLI format name -> ExportFormat
+FORMAT_MAP = {
+    'yaml': ExportFormat.YAML,
+    'json': ExportFormat.JSON
+}
+
 
 def setup_argument_parser() -> argparse.ArgumentParser:
     """Setup command line argument parser"""
@@ -63,11 +81,10 @@ Examples:
     export_parser = subparsers.add_parser('export', help='Export configuration')
     export_parser.add_argument('config_file', help='Configuration file to export')
     export_parser.add_argument('--output', '-o', required=True, help='Output file path')
-    export_parser.add_argument('--format', '-f', choices=['yaml', 'json'], default='yaml',
+    export_parser.add_argument('--format', '-f', choices=list(FORMAT_MAP), default='yaml',
                               help='Export format (default: yaml)')
     export_parser.add_argument('--sections', '-s', nargs='+', 
-                              choices=['server', 'database', 'security', 'comfyui', 'ollama', 
-                                     'resources', 'logging', 'monitoring'],
+                              choices=list(SECTION_MAP),
                               help='Specific sections to export (default: all)')
     export_parser.add_argument('--template', '-t', action='store_true',
                               help='Export as template (remove sensitive data)')
@@ -79,8 +96,7 @@ Examples:
     import_parser.add_argument('import_file', help='Configuration file to import')
     import_parser.add_argument('--target', required=True, help='Target configuration file')
     import_parser.add_argument('--sections', '-s', nargs='+',
-                              choices=['server', 'database', 'security', 'comfyui', 'ollama',
-                                     'resources', 'logging', 'monitoring'],
+                              choices=list(SECTION_MAP),
                               help='Specific sections to import (default: all)')
     import_parser.add_argument('--merge', '-m', action='store_true',
                               help='Merge with existing configuration instead of replacing')
@@ -118,8 +134,7 @@ Examples:
     template_parser.add_argument('--name', '-n', required=True, help='Template name')
     template_parser.add_argument('--description', '-d', default='', help='Template description')
     template_parser.add_argument('--sections', '-s', nargs='+',
-                                choices=['server', 'database', 'security', 'comfyui', 'ollama',
-                                       'resources', 'logging', 'monitoring'],
+                                choices=list(SECTION_MAP),
                                 help='Specific sections to include in template')
     
     return parser
@@ -130,18 +145,7 @@ def parse_sections(sections: Optional[List[str]]) -> Optional[List[ConfigSection
     if not sections:
         return None
     
-    section_map = {
-        'server': ConfigSection.SERVER,
-        'database': ConfigSection.DATABASE,
-        'security': ConfigSection.SECURITY,
-        'comfyui': ConfigSection.COMFYUI,
-        'ollama': ConfigSection.OLLAMA,
-        'resources': ConfigSection.RESOURCES,
-        'logging': ConfigSection.LOGGING,
-        'monitoring': ConfigSection.MONITORING
-    }
-    
-    return [section_map[s] for s in sections if s in section_map]
+    return [SECTION_MAP[s] for s in sections if s in SECTION_MAP]
 
 
 def command_export(args) -> int:
@@ -151,7 +155,7 @@ def command_export(args) -> int:
         config = load_config(args.config_file)
         
         # Setup export parameters
-        format = ExportFormat.JSON if args.format == 'json' else ExportFormat.YAML
+        format = FORMAT_MAP[args.format]
         sections = parse_sections(args.sections)
         
         # Create manager and export
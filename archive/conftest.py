@@ -0,0 +1,14 @@
+"""
+Root pytest configuration for DinoAir.
+
+Puts the project root on ``sys.path`` once per session so test modules can
+import ``lib`` and the top-level scripts without touching the path themselves.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
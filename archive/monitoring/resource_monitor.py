@@ -16,7 +16,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
-from collections import deque
+from collections import Counter, deque
 import statistics
 
 class ResourceType(Enum):
@@ -44,7 +44,7 @@ class AlertChannel(Enum):
     FILE = "file"
     CONSOLE = "console"
 
-@dataclass
+@dataclass(slots=True)
 class ResourceThreshold:
     """Threshold configuration for resource monitoring"""
     resource_type: ResourceType
@@ -55,7 +55,7 @@ class ResourceThreshold:
     duration: int = 60  # seconds - how long threshold must be exceeded
     check_interval: int = 5  # seconds between checks
 
-@dataclass
+@dataclass(slots=True)
 class ResourceMetric:
     """A single resource measurement"""
     resource_type: ResourceType
@@ -65,7 +65,7 @@ class ResourceMetric:
     timestamp: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Alert information"""
     id: str
@@ -146,6 +146,7 @@ class ResourceMonitor:
         
         # Alert tracking
         self.active_alerts: Dict[str, Alert] = {}
+        self._active_alert_levels: Counter = Counter()
         self.alert_history: List[Alert] = []
         self.last_alert_time: Dict[str, datetime] = {}
         
@@ -153,11 +154,21 @@ class ResourceMonitor:
         self._running = False
         self._monitor_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        self._stop_event = threading.Event()
         
         # Callbacks
         self.on_alert: List[Callable[[Alert], None]] = []
         self.on_metric: List[Callable[[ResourceMetric], None]] = []
         
+        # Alert delivery handlers
+        self._alert_senders: Dict[AlertChannel, Callable[[Alert], None]] = {
+            AlertChannel.LOG: self._send_log_alert,
+            AlertChannel.EMAIL: self._send_email_alert,
+            AlertChannel.WEBHOOK: self._send_webhook_alert,
+            AlertChannel.FILE: self._send_file_alert,
+            AlertChannel.CONSOLE: self._send_console_alert,
+        }
+        
         # GPU availability
         self._gpu_available = self._check_gpu_availability()
     
@@ -176,6 +187,7 @@ class ResourceMonitor:
             return
         
         self._running = True
+        self._stop_event.clear()
         self._monitor_thread = threading.Thread(
             target=self._monitor_loop,
             daemon=True,
@@ -184,12 +196,17 @@ class ResourceMonitor:
         self._monitor_thread.start()
         self.logger.info("Resource monitoring started")
     
-    def stop(self):
-        """Stop resource monitoring"""
+    def stop(self) -> bool:
+        """Stop resource monitoring, returning True once the thread has exited"""
         self._running = False
+        self._stop_event.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
+            if self._monitor_thread.is_alive():
+                self.logger.warning("Resource monitor thread did not stop in time")
+                return False
         self.logger.info("Resource monitoring stopped")
+        return True
     
     def _monitor_loop(self):
         """Main monitoring loop"""
@@ -212,12 +229,12 @@ class ResourceMonitor:
                         except Exception as e:
                             self.logger.error(f"Error in metric callback: {e}")
                 
-                # Sleep until next check
-                time.sleep(self.config.check_interval)
+                # Sleep until next check, waking early on stop()
+                self._stop_event.wait(self.config.check_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitor loop: {e}")
-                time.sleep(self.config.check_interval)
+                self._stop_event.wait(self.config.check_interval)
     
     def _collect_metrics(self) -> List[ResourceMetric]:
         """Collect all resource metrics"""
@@ -698,14 +715,17 @@ class ResourceMonitor:
     def _create_or_update_alert(self, alert_key: str, metric: ResourceMetric, 
                                level: AlertLevel, threshold: float):
         """Create or update an alert"""
+        # Read the clock once and reuse it for cooldown, id and timestamps
+        now = datetime.now()
+        
         # Check cooldown
         if alert_key in self.last_alert_time:
-            time_since_last = (datetime.now() - self.last_alert_time[alert_key]).total_seconds()
+            time_since_last = (now - self.last_alert_time[alert_key]).total_seconds()
             if time_since_last < self.config.alert_cooldown:
                 return
         
         # Create alert
-        alert_id = f"{alert_key}_{int(time.time())}"
+        alert_id = f"{alert_key}_{int(now.timestamp())}"
         
         alert = Alert(
             id=alert_id,
@@ -715,15 +735,19 @@ class ResourceMonitor:
             value=metric.value,
             threshold=threshold,
             message=self._generate_alert_message(metric, level, threshold),
-            timestamp=datetime.now(),
+            timestamp=now,
             metadata=metric.metadata
         )
         
         # Store alert
         with self._lock:
+            previous = self.active_alerts.get(alert_key)
+            if previous is not None:
+                self._active_alert_levels[previous.level] -= 1
+            self._active_alert_levels[level] += 1
             self.active_alerts[alert_key] = alert
             self.alert_history.append(alert)
-            self.last_alert_time[alert_key] = datetime.now()
+            self.last_alert_time[alert_key] = now
         
         # Send alert
         self._send_alert(alert)
@@ -744,6 +768,7 @@ class ResourceMonitor:
                 alert.resolved_at = datetime.now()
                 
                 del self.active_alerts[alert_key]
+                self._active_alert_levels[alert.level] -= 1
                 
                 # Send resolution notification
                 self._send_alert_resolution(alert)
@@ -770,17 +795,11 @@ class ResourceMonitor:
     def _send_alert(self, alert: Alert):
         """Send alert through configured channels"""
         for channel in self.config.alert_channels:
+            sender = self._alert_senders.get(channel)
+            if sender is None:
+                continue
             try:
-                if channel == AlertChannel.LOG:
-                    self._send_log_alert(alert)
-                elif channel == AlertChannel.EMAIL:
-                    self._send_email_alert(alert)
-                elif channel == AlertChannel.WEBHOOK:
-                    self._send_webhook_alert(alert)
-                elif channel == AlertChannel.FILE:
-                    self._send_file_alert(alert)
-                elif channel == AlertChannel.CONSOLE:
-                    self._send_console_alert(alert)
+                sender(alert)
             except Exception as e:
                 self.logger.error(f"Failed to send alert via {channel.value}: {e}")
     
@@ -886,7 +905,8 @@ class ResourceMonitor:
         return current
     
     def get_metric_history(self, resource_type: ResourceType, metric: str, 
-                          duration: Optional[int] = None) -> List[ResourceMetric]:
+                          duration: Optional[int] = None,
+                          now: Optional[datetime] = None) -> List[ResourceMetric]:
         """Get metric history"""
         key = f"{resource_type.value}_{metric}"
         
@@ -897,15 +917,16 @@ class ResourceMonitor:
             history = list(self.metrics_history[key])
             
             if duration:
-                cutoff = datetime.now() - timedelta(seconds=duration)
+                cutoff = (now or datetime.now()) - timedelta(seconds=duration)
                 history = [m for m in history if m.timestamp >= cutoff]
             
             return history
     
     def get_metric_statistics(self, resource_type: ResourceType, metric: str,
-                            duration: int = 3600) -> Dict[str, float]:
+                            duration: int = 3600,
+                            now: Optional[datetime] = None) -> Dict[str, float]:
         """Get statistics for a metric over duration"""
-        history = self.get_metric_history(resource_type, metric, duration)
+        history = self.get_metric_history(resource_type, metric, duration, now)
         
         if not history:
             return {}
@@ -929,28 +950,35 @@ class ResourceMonitor:
     def get_system_report(self) -> Dict[str, Any]:
         """Get comprehensive system report"""
         current_metrics = self.get_current_metrics()
+        now = datetime.now()
+        
+        # Take one consistent snapshot of the active alerts and their level
+        # counts under the lock, so the status agrees with the alert list
+        with self._lock:
+            active_alerts = list(self.active_alerts.values())
+            alert_levels = self._active_alert_levels.copy()
         
         # Extract key metrics
         cpu_usage = current_metrics.get("cpu_usage_percent", ResourceMetric(
-            ResourceType.CPU, "usage_percent", 0, "%", datetime.now()
+            ResourceType.CPU, "usage_percent", 0, "%", now
         )).value
         
         memory_usage = current_metrics.get("memory_usage_percent", ResourceMetric(
-            ResourceType.MEMORY, "usage_percent", 0, "%", datetime.now()
+            ResourceType.MEMORY, "usage_percent", 0, "%", now
         )).value
         
         disk_usage = current_metrics.get("disk_usage_percent", ResourceMetric(
-            ResourceType.DISK, "usage_percent", 0, "%", datetime.now()
+            ResourceType.DISK, "usage_percent", 0, "%", now
         )).value
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "summary": {
                 "cpu_usage": cpu_usage,
                 "memory_usage": memory_usage,
                 "disk_usage": disk_usage,
-                "active_alerts": len(self.active_alerts),
-                "status": self._get_overall_status()
+                "active_alerts": len(active_alerts),
+                "status": self._get_overall_status(alert_levels)
             },
             "alerts": [
                 {
@@ -959,26 +987,24 @@ class ResourceMonitor:
                     "metric": alert.metric,
                     "value": alert.value,
                     "threshold": alert.threshold,
-                    "duration": (datetime.now() - alert.timestamp).total_seconds()
+                    "duration": (now - alert.timestamp).total_seconds()
                 }
-                for alert in self.get_active_alerts()
+                for alert in active_alerts
             ],
             "resources": {
-                "cpu": self.get_metric_statistics(ResourceType.CPU, "usage_percent", 300),
-                "memory": self.get_metric_statistics(ResourceType.MEMORY, "usage_percent", 300),
-                "disk": self.get_metric_statistics(ResourceType.DISK, "usage_percent", 300)
+                "cpu": self.get_metric_statistics(ResourceType.CPU, "usage_percent", 300, now),
+                "memory": self.get_metric_statistics(ResourceType.MEMORY, "usage_percent", 300, now),
+                "disk": self.get_metric_statistics(ResourceType.DISK, "usage_percent", 300, now)
             }
         }
     
-    def _get_overall_status(self) -> str:
-        """Get overall system status"""
-        active_alerts = self.get_active_alerts()
-        
-        if any(a.level == AlertLevel.EMERGENCY for a in active_alerts):
+    def _get_overall_status(self, levels: Counter) -> str:
+        """Get overall system status from a snapshot of active alert level counts"""
+        if levels[AlertLevel.EMERGENCY] > 0:
             return "EMERGENCY"
-        elif any(a.level == AlertLevel.CRITICAL for a in active_alerts):
+        elif levels[AlertLevel.CRITICAL] > 0:
             return "CRITICAL"
-        elif any(a.level == AlertLevel.WARNING for a in active_alerts):
+        elif levels[AlertLevel.WARNING] > 0:
             return "WARNING"
         else:
             return "HEALTHY"
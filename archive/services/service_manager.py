@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Dict, Optional
 import logging
 
+# How long a snapshot of listening ports is reused before rescanning
+PORT_SCAN_TTL = 1.0
+
 class ServiceManager:
     """Manage DinoAir services (ComfyUI, Ollama, Web GUI)"""
     
@@ -16,6 +19,10 @@ class ServiceManager:
         self.services = self.load_service_config()
         self.logger = logging.getLogger(__name__)
         self.processes = {}
+        # Reuse one keep-alive connection pool for all readiness probes
+        self.session = requests.Session()
+        self._listening_ports = frozenset()
+        self._listening_ports_at = float("-inf")
         
     def load_service_config(self) -> Dict:
         """Load service configuration"""
@@ -73,7 +80,8 @@ class ServiceManager:
             self.logger.error(f"No start command defined for {service_name}")
             return False
         
-        # Check if already running
+        # Check if already running, against a fresh port scan
+        self.invalidate_listening_ports()
         if self.is_service_running(service_name):
             self.logger.info(f"{service_name} is already running")
             return True
@@ -86,6 +94,7 @@ class ServiceManager:
                 stderr=subprocess.PIPE
             )
             self.processes[service_name] = process
+            self.invalidate_listening_ports()
             
             # Wait for service to be ready
             if await self.wait_for_service(service_name):
@@ -115,10 +124,12 @@ class ServiceManager:
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(endpoint, timeout=5)
+                # Run the blocking probe off the event loop so other
+                # services can be started/stopped while this one warms up
+                response = await asyncio.to_thread(self.session.get, endpoint, timeout=5)
                 if response.status_code == 200:
                     return True
-            except:
+            except requests.RequestException:
                 pass
             
             await asyncio.sleep(1)
@@ -131,11 +142,22 @@ class ServiceManager:
         port = service_config["port"]
         
         # Check if port is in use
-        for conn in psutil.net_connections():
-            if conn.laddr.port == port and conn.status == 'LISTEN':
-                return True
-        
-        return False
+        return port in self.get_listening_ports()
+    
+    def get_listening_ports(self) -> frozenset:
+        """Return the set of listening ports, rescanning at most once per TTL"""
+        now = time.monotonic()
+        if now - self._listening_ports_at >= PORT_SCAN_TTL:
+            self._listening_ports = frozenset(
+                conn.laddr.port for conn in psutil.net_connections()
+                if conn.status == 'LISTEN'
+            )
+            self._listening_ports_at = now
+        return self._listening_ports
+    
+    def invalidate_listening_ports(self):
+        """Force the next port check to rescan, e.g. after a start or stop"""
+        self._listening_ports_at = float("-inf")
     
     async def stop_service(self, service_name: str):
         """Stop a specific service"""
@@ -150,8 +172,13 @@ class ServiceManager:
                 process.kill()
             
             del self.processes[service_name]
+            self.invalidate_listening_ports()
             self.logger.info(f"✅ {service_name} stopped")
     
+    def close(self):
+        """Release the pooled HTTP connections used for readiness probes"""
+        self.session.close()
+    
     async def start_all(self):
         """Start all services"""
         self.logger.info("Starting all services...")
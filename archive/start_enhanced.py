@@ -68,6 +68,7 @@ class DinoAirLauncher:
             except KeyboardInterrupt:
                 logger.info("\n🛑 Shutting down DinoAir...")
                 await self.service_manager.stop_all()
+                self.service_manager.close()
                 monitor_task.cancel()
                 
         except Exception as e:
@@ -0,0 +1,65 @@
+"""
+Tests for ConfigManager file round-trips
+"""
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from config.config_manager import ConfigManager
+
+
+def test_non_str_keys_round_trip(tmp_path):
+    """Sections with non-str keys are saved and read back as JSON strings"""
+    manager = ConfigManager(tmp_path)
+    manager.update_config("services", {1: 2})
+
+    reloaded = ConfigManager(tmp_path).load_config("services")
+
+    assert reloaded["1"] == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_save_preserves_file_mode(tmp_path):
+    """Rewriting a config keeps the existing file's permissions"""
+    manager = ConfigManager(tmp_path)
+    manager.load_config("security")
+    security_file = tmp_path / "security.json"
+    security_file.chmod(0o600)
+
+    manager.update_config("security", {"api_key_required": False})
+
+    assert stat.S_IMODE(security_file.stat().st_mode) == 0o600
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+@pytest.mark.parametrize("config_name,file_name", [
+    ("main", "config.yaml"),
+    ("services", "services.json"),
+])
+def test_new_file_mode_follows_umask(tmp_path, config_name, file_name):
+    """Newly created configs get the umask-derived mode, not owner-only"""
+    old_umask = os.umask(0o022)
+    try:
+        ConfigManager(tmp_path).load_config(config_name)
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE((tmp_path / file_name).stat().st_mode) == 0o644
+
+
+def test_concurrent_saves_do_not_collide(tmp_path):
+    """Threads saving the same file each get their own temporary file"""
+    manager = ConfigManager(tmp_path)
+    # Seed the key so concurrent updates only change values, never dict size
+    manager.update_config("services", {"n": -1})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: manager.update_config("services", {"n": i}), range(32)))
+
+    assert ConfigManager(tmp_path).load_config("services")["n"] in range(32)
+    assert not list(tmp_path.glob("*.tmp"))
@@ -2,10 +2,14 @@
 Test memory leak fixes implementation
 """
 
+import logging
 import pytest
 import time
 import threading
 from unittest.mock import Mock, patch
+
+pytest.importorskip("lib.process_manager.safe_process_manager")
+
 from lib.process_manager.safe_process_manager import (
     ProcessManager, 
     ManagedService, 
@@ -14,16 +18,45 @@ from lib.process_manager.safe_process_manager import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _no_real_popen(monkeypatch):
+    """Fail loudly if a test would fork a real process; use `popen` instead"""
+    def _refuse(*args, **kwargs):
+        raise AssertionError(f"Real subprocess.Popen called with {args}")
+    monkeypatch.setattr('subprocess.Popen', _refuse)
+
+
+@pytest.fixture
+def service():
+    """ManagedService whose monitor thread is always reaped after the test"""
+    config = ServiceConfig(name="test", command=["echo", "test"])
+    # A real logger: monitor threads log every tick, which a Mock would
+    # record forever for the lifetime of the test
+    service = ManagedService(config, logging.getLogger("tests.memory_leak"))
+    yield service
+
+    # Don't let a failed assertion leave a monitor thread running
+    service._stop_event.set()
+    thread = service._monitor_thread
+    if thread is not None and thread.is_alive():
+        thread.join(timeout=1)
+
+
+@pytest.fixture
+def popen():
+    """Patch subprocess.Popen to hand out a single running stub process"""
+    process = Mock(pid=12345)
+    process.poll.return_value = None  # Running
+    process.wait.return_value = 0
+    with patch('subprocess.Popen', return_value=process) as mock_popen:
+        yield mock_popen
+
+
 class TestMemoryLeakFixes:
     """Test that memory leak fixes are working correctly"""
 
-    def test_bounded_metric_history(self):
+    def test_bounded_metric_history(self, service):
         """Test that metric history arrays don't grow unbounded"""
-        # Mock logger to avoid logging setup
-        mock_logger = Mock()
-        config = ServiceConfig(name="test", command=["echo", "test"])
-        service = ManagedService(config, mock_logger)
-        
         # Add more than 60 samples to test bounds
         for i in range(100):
             service._update_metric_history(service.cpu_usage_history, i)
@@ -32,47 +65,31 @@ class TestMemoryLeakFixes:
         assert len(service.cpu_usage_history) <= 60
         assert service.cpu_usage_history[-1] == 99  # Last value preserved
         
-    def test_monitor_thread_cleanup(self):
+    def test_monitor_thread_cleanup(self, service, popen):
         """Test that monitor threads are properly cleaned up"""
-        mock_logger = Mock()
-        config = ServiceConfig(name="test", command=["echo", "test"])
-        service = ManagedService(config, mock_logger)
-        
-        # Mock process and start service 
-        with patch('subprocess.Popen') as mock_popen:
-            mock_process = Mock()
-            mock_process.pid = 12345
-            mock_process.poll.return_value = None  # Running
-            mock_process.stdout = Mock()
-            mock_process.stderr = Mock()
-            mock_popen.return_value = mock_process
-            service.process = mock_process
-            
-            # Start monitoring thread
-            service.status = ServiceStatus.RUNNING
-            service.start_time = time.time()
-            service._stop_event.clear()
-            service._monitor_thread = threading.Thread(
-                target=service._monitor_process,
-                name=f"{service.config.name}_monitor"
-            )
-            service._monitor_thread.start()
-            
-            # Wait a moment for thread to start
-            time.sleep(0.1)
-            
-            # Stop service
-            service.stop()
-            
-            # Monitor thread should be stopped
-            assert not service._monitor_thread.is_alive()
+        service.process = popen.return_value
+        
+        # Start monitoring thread
+        service.status = ServiceStatus.RUNNING
+        service.start_time = time.time()
+        service._stop_event.clear()
+        service._monitor_thread = threading.Thread(
+            target=service._monitor_process,
+            name=f"{service.config.name}_monitor"
+        )
+        service._monitor_thread.start()
+        
+        # Wait a moment for thread to start
+        time.sleep(0.1)
+        
+        # Stop service
+        service.stop()
+        
+        # Monitor thread should be stopped
+        assert not service._monitor_thread.is_alive()
             
-    def test_stream_cleanup_on_error(self):
+    def test_stream_cleanup_on_error(self, service):
         """Test that streams are cleaned up on errors"""
-        mock_logger = Mock()
-        config = ServiceConfig(name="test", command=["echo", "test"])
-        service = ManagedService(config, mock_logger)
-        
         # Mock process with streams
         mock_process = Mock()
         mock_stdout = Mock()
@@ -117,62 +134,44 @@ class TestMemoryLeakFixes:
                 # Should stop all services
                 mock_stop.assert_called_once()
                 
-    def test_restart_prevents_zombie_threads(self):
+    def test_restart_prevents_zombie_threads(self, service, popen):
         """Test that restart properly cleans up old threads"""
-        mock_logger = Mock()
-        config = ServiceConfig(name="test", command=["echo", "test"])
-        service = ManagedService(config, mock_logger)
-        
-        with patch('subprocess.Popen') as mock_popen:
-            mock_process = Mock()
-            mock_process.pid = 12345
-            mock_process.poll.return_value = None
-            mock_process.wait.return_value = 0
-            mock_process.stdout = Mock()
-            mock_process.stderr = Mock() 
-            mock_process.stdin = Mock()
-            mock_popen.return_value = mock_process
+        # Mock successful start
+        with patch.object(service, '_is_port_available', return_value=True):
+            # Override config restart delay to speed up test
+            service.config.restart_delay_seconds = 0
             
-            # Mock successful start
-            with patch.object(service, '_is_port_available', return_value=True):
-                # Override config restart delay to speed up test
-                service.config.restart_delay_seconds = 0
-                
-                service.start()
-                time.sleep(0.1)  # Let thread start
-                
-                old_thread = service._monitor_thread
-                old_thread_name = old_thread.name if old_thread else None
-                
-                # Stop the service manually to see cleanup
-                service.stop()
-                time.sleep(0.1)  # Let thread stop
-                
-                # Verify old thread is dead
+            service.start()
+            time.sleep(0.1)  # Let thread start
+            
+            old_thread = service._monitor_thread
+            old_thread_name = old_thread.name if old_thread else None
+            
+            # Stop the service manually to see cleanup
+            service.stop()
+            time.sleep(0.1)  # Let thread stop
+            
+            # Verify old thread is dead
+            if old_thread:
+                assert not old_thread.is_alive()
+            
+            # Start again - should have new thread
+            service.start()
+            time.sleep(0.1)  # Let new thread start
+            
+            new_thread = service._monitor_thread
+            
+            # Should have a running new thread
+            if new_thread:
+                assert new_thread.is_alive()
+                # Verify it's a different thread object (different identity)
                 if old_thread:
-                    assert not old_thread.is_alive()
-                
-                # Start again - should have new thread
-                service.start()
-                time.sleep(0.1)  # Let new thread start
-                
-                new_thread = service._monitor_thread
-                
-                # Should have a running new thread
-                if new_thread:
-                    assert new_thread.is_alive()
-                    # Verify it's a different thread object (different identity)
-                    if old_thread:
-                        assert new_thread is not old_thread, "Should be a new thread object"
-                        
-                service.stop()
-                
-    def test_read_process_output_handles_closed_streams(self):
+                    assert new_thread is not old_thread, "Should be a new thread object"
+                    
+            service.stop()
+            
+    def test_read_process_output_handles_closed_streams(self, service):
         """Test that _read_process_output handles closed streams gracefully"""
-        mock_logger = Mock()
-        config = ServiceConfig(name="test", command=["echo", "test"])
-        service = ManagedService(config, mock_logger)
-        
         # Mock process with closed streams
         mock_process = Mock()
         mock_stdout = Mock()
@@ -0,0 +1,79 @@
+"""
+Tests for ServiceManager port-state caching
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+pytest.importorskip("psutil")
+requests = pytest.importorskip("requests")
+
+from services.service_manager import ServiceManager
+
+
+def _listening(*ports):
+    """Fake psutil.net_connections() result with the given LISTEN ports"""
+    return [SimpleNamespace(laddr=SimpleNamespace(port=port), status="LISTEN") for port in ports]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """ServiceManager using the built-in default service configuration"""
+    manager = ServiceManager(tmp_path / "services.json")
+    yield manager
+    manager.close()
+
+
+def test_stop_service_invalidates_port_cache(manager):
+    """A stop is reflected immediately, not after the port-scan TTL"""
+    port = manager.services["ollama"]["port"]
+    manager.processes["ollama"] = Mock()
+
+    with patch("psutil.net_connections", return_value=_listening(port)) as scan:
+        assert manager.is_service_running("ollama")
+
+        scan.return_value = _listening()
+        asyncio.run(manager.stop_service("ollama"))
+
+        assert not manager.is_service_running("ollama")
+
+
+def test_port_cache_reused_within_ttl(manager):
+    """Back-to-back status checks share one port scan"""
+    with patch("psutil.net_connections", return_value=_listening()) as scan:
+        manager.get_service_status()
+
+    scan.assert_called_once()
+
+
+def test_wait_for_service_cancelled_mid_probe(manager):
+    """Cancelling the wait while a probe is in flight stops it immediately"""
+    probing = threading.Event()
+    release = threading.Event()
+
+    def hanging_probe(*args, **kwargs):
+        probing.set()
+        release.wait(5)
+        raise requests.ConnectionError()
+
+    async def scenario():
+        task = asyncio.create_task(manager.wait_for_service("ollama", timeout=8))
+        await asyncio.to_thread(probing.wait, 5)
+        task.cancel()
+        await asyncio.wait({task}, timeout=2)
+        release.set()
+        return task
+
+    with patch.object(manager.session, "get", side_effect=hanging_probe):
+        try:
+            task = asyncio.run(scenario())
+        finally:
+            release.set()
+
+    assert task.cancelled()
+    with pytest.raises(asyncio.CancelledError):
+        task.result()
@@ -20,6 +20,11 @@ class TestStartFunctions(unittest.TestCase):
         """Set up test fixtures"""
         # Clear running_processes list
         start.running_processes.clear()
+        
+        # start.py pauses between launches and monitor polls; never really sleep
+        sleep_patcher = patch('time.sleep')
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
     
     def tearDown(self):
         """Clean up after tests"""
@@ -62,8 +67,7 @@ class TestStartFunctions(unittest.TestCase):
     
     @patch('start.start_web_gui')
     @patch('start.start_comfyui') 
-    @patch('time.sleep')
-    def test_start_services_both_successful(self, mock_sleep, mock_start_comfyui, mock_start_web_gui):
+    def test_start_services_both_successful(self, mock_start_comfyui, mock_start_web_gui):
         """Test starting services when both start successfully"""
         mock_comfyui_process = Mock()
         mock_web_gui_process = Mock()
@@ -77,12 +81,11 @@ class TestStartFunctions(unittest.TestCase):
         self.assertEqual(len(start.running_processes), 2)
         self.assertIn(mock_comfyui_process, start.running_processes)
         self.assertIn(mock_web_gui_process, start.running_processes)
-        mock_sleep.assert_called_once_with(3)
+        self.mock_sleep.assert_called_once_with(3)
     
     @patch('start.start_web_gui')
     @patch('start.start_comfyui')
-    @patch('time.sleep')
-    def test_start_services_comfyui_only(self, mock_sleep, mock_start_comfyui, mock_start_web_gui):
+    def test_start_services_comfyui_only(self, mock_start_comfyui, mock_start_web_gui):
         """Test starting services when only ComfyUI starts"""
         mock_comfyui_process = Mock()
         
@@ -97,8 +100,7 @@ class TestStartFunctions(unittest.TestCase):
     
     @patch('start.start_web_gui')
     @patch('start.start_comfyui')
-    @patch('time.sleep')
-    def test_start_services_none_successful(self, mock_sleep, mock_start_comfyui, mock_start_web_gui):
+    def test_start_services_none_successful(self, mock_start_comfyui, mock_start_web_gui):
         """Test starting services when none start"""
         mock_start_comfyui.return_value = None
         mock_start_web_gui.return_value = None
@@ -122,9 +124,8 @@ class TestStartFunctions(unittest.TestCase):
         # Check for the line that contains the stop message
         self.assertTrue(any("Press Ctrl+C to stop all services." in str(call) for call in call_args_list))
     
-    @patch('time.sleep')
     @patch('builtins.print')
-    def test_monitor_services_all_stop(self, mock_print, mock_sleep):
+    def test_monitor_services_all_stop(self, mock_print):
         """Test monitoring services until all stop"""
         # Create mock processes that will "stop" after one iteration
         mock_process1 = Mock()
@@ -145,7 +146,7 @@ class TestStartFunctions(unittest.TestCase):
                 for process in start.running_processes[:]:
                     process.poll.return_value = 0
         
-        mock_sleep.side_effect = mock_sleep_side_effect
+        self.mock_sleep.side_effect = mock_sleep_side_effect
         
         start.monitor_services()
         
@@ -155,9 +156,8 @@ class TestStartFunctions(unittest.TestCase):
         # Processes should have been removed
         self.assertEqual(len(start.running_processes), 0)
     
-    @patch('time.sleep')
     @patch('builtins.print')
-    def test_monitor_services_keyboard_interrupt(self, mock_print, mock_sleep):
+    def test_monitor_services_keyboard_interrupt(self, mock_print):
         """Test monitoring services with keyboard interrupt"""
         mock_process = Mock()
         mock_process.poll.return_value = None  # Still running
@@ -168,7 +168,7 @@ class TestStartFunctions(unittest.TestCase):
         def mock_sleep_side_effect(duration):
             raise KeyboardInterrupt()
         
-        mock_sleep.side_effect = mock_sleep_side_effect
+        self.mock_sleep.side_effect = mock_sleep_side_effect
         
         # Should not raise exception, should handle gracefully
         start.monitor_services()